@@ -4,10 +4,23 @@ Runs on Raspberry Pi Pico 2 W with CircuitPython
 """
 
 import time
+from array import array
 import board
 import busio
 import digitalio
 import usb_hid
+from supervisor import ticks_ms
+try:
+    import micropython
+    from micropython import const
+except ImportError:
+    # Not on MicroPython/CircuitPython: make the code-emitter decorators and
+    # const() no-ops
+    class micropython:
+        native = viper = staticmethod(lambda f: f)
+
+    def const(value):
+        return value
 import adafruit_nunchuk
 from adafruit_hid.keyboard import Keyboard
 from adafruit_hid.keycode import Keycode
@@ -15,97 +28,144 @@ from adafruit_hid.mouse import Mouse
 
 # --- Configuration ---
 
+# Integer settings are wrapped in const() so the compiler inlines their values
+
 # I2C pins (GP4=SDA, GP5=SCL)
 I2C_SDA = board.GP4
 I2C_SCL = board.GP5
 
 # Joystick settings
-JOY_CENTER = 128
-JOY_DEADZONE = 25  # Ignore values within center ± deadzone
+JOY_CENTER = const(128)
+JOY_DEADZONE = const(25)  # Ignore values within center ± deadzone
 
 # Joystick-to-mouse sensitivity (pixels per tick at max deflection)
-MOUSE_SENSITIVITY = 15
+MOUSE_SENSITIVITY = const(15)
 
 # Joystick-to-scroll speed: divider for scroll wheel (higher = slower scroll)
-SCROLL_DIVIDER = 40
+SCROLL_DIVIDER = const(40)
 
 # Orbit sensitivity (Z held + joystick)
-ORBIT_SENSITIVITY = 12  # Mouse pixels per tick for orbit movement
+ORBIT_SENSITIVITY = const(12)  # Mouse pixels per tick for orbit movement
 
 # Button tap detection
-TAP_MAX_DURATION = 0.3  # Max seconds for a press to count as a tap
+TAP_MAX_MS = const(300)  # Max milliseconds for a press to count as a tap
+
+# supervisor.ticks_ms() wraps at 2**29; mask time differences with TICKS_PERIOD - 1
+TICKS_PERIOD = const(1 << 29)
 
 # Main loop timing
-LOOP_DELAY = 0.01  # 100Hz update rate
+LOOP_MS = const(10)  # 100Hz update rate
+
+# Diagnostics: serial console logging, pull-up check and I2C bus scan at
+# startup (slows boot)
+DIAG = False
 
 # --- State tracking ---
 
-class ButtonState:
-    """Track press/release for tap vs hold detection."""
-
-    def __init__(self):
-        self.is_pressed = False
-        self.press_time = 0.0
-        self.moved_during_press = False
-        self.was_held = False
-
-    def update(self, pressed, now, moved):
-        """Update button state. Returns 'tap', 'hold_start', 'hold_end', or None."""
-        event = None
-
-        if pressed and not self.is_pressed:
-            # Button just pressed
-            self.is_pressed = True
-            self.press_time = now
-            self.moved_during_press = False
-            self.was_held = False
-
-        elif pressed and self.is_pressed:
-            # Button still held
-            if moved:
-                self.moved_during_press = True
-            duration = now - self.press_time
-            if duration > TAP_MAX_DURATION and not self.was_held:
-                self.was_held = True
-                event = "hold_start"
-
-        elif not pressed and self.is_pressed:
-            # Button just released
-            self.is_pressed = False
-            duration = now - self.press_time
-            if self.was_held:
-                event = "hold_end"
-            elif duration <= TAP_MAX_DURATION and not self.moved_during_press:
-                event = "tap"
-
-        return event
-
-
-def scale_axis(value, center, deadzone, sensitivity):
-    """Scale an axis value from raw to mouse movement."""
-    offset = value - center
-    if abs(offset) <= deadzone:
-        return 0
-    # Remove deadzone from the offset
-    if offset > 0:
-        offset -= deadzone
+# Button indices into the state arrays below
+BTN_C = const(0)
+BTN_Z = const(1)
+
+# Button state flag bits
+BTN_PRESSED = const(0x01)  # is pressed
+BTN_HELD = const(0x02)     # pressed longer than TAP_MAX_MS
+BTN_MOVED = const(0x04)    # joystick moved during this press
+
+# Per-button press start time (ticks_ms) and state flags, indexed by BTN_C/BTN_Z
+_press_time = array("l", [0, 0])
+_flags = bytearray(2)
+
+
+@micropython.native
+def btn_update(i, pressed, now, moved):
+    """Update button i's state. Returns 'tap', 'hold_start', 'hold_end', or None."""
+    flags = _flags[i]
+    # Transition index: (was pressed) << 1 | (is pressed)
+    transition = ((flags & BTN_PRESSED) << 1) | pressed
+
+    if transition == 0b00:
+        # Button idle
+        return None
+
+    event = None
+
+    if transition == 0b11:
+        # Button still held
+        if moved:
+            flags |= BTN_MOVED
+        duration = (now - _press_time[i]) & (TICKS_PERIOD - 1)
+        if duration > TAP_MAX_MS and not (flags & BTN_HELD):
+            flags |= BTN_HELD
+            event = "hold_start"
+
+    elif transition == 0b01:
+        # Button just pressed
+        _press_time[i] = now
+        flags = BTN_PRESSED
+
+    else:
+        # Button just released
+        duration = (now - _press_time[i]) & (TICKS_PERIOD - 1)
+        if flags & BTN_HELD:
+            event = "hold_end"
+        elif duration <= TAP_MAX_MS and not (flags & BTN_MOVED):
+            event = "tap"
+        flags = 0
+
+    _flags[i] = flags
+    return event
+
+
+# Axis scale factors in 1/65536 units, precomputed so scale_axis_fast() is
+# a single integer multiply and shift. Rounded up so full deflection still
+# reaches the full sensitivity.
+SCALE_MOUSE_K = const(-(-MOUSE_SENSITIVITY * 65536 // (JOY_CENTER - JOY_DEADZONE)))
+SCALE_ORBIT_K = const(-(-ORBIT_SENSITIVITY * 65536 // (JOY_CENTER - JOY_DEADZONE)))
+
+
+@micropython.viper
+def scale_axis_fast(value: int, k: int) -> int:
+    """Scale an axis value from raw to mouse movement using a precomputed factor."""
+    o = value - JOY_CENTER
+    # Scale the magnitude so positive and negative deflections round the same way
+    if o > JOY_DEADZONE:
+        v = ((o - JOY_DEADZONE) * k) >> 16
+    elif o < -JOY_DEADZONE:
+        v = 0 - ((((0 - o) - JOY_DEADZONE) * k) >> 16)
     else:
-        offset += deadzone
-    # Scale to sensitivity range
-    max_range = center - deadzone
-    if max_range <= 0:
         return 0
-    scaled = (offset / max_range) * sensitivity
-    return int(max(min(scaled, 127), -127))
+    return 127 if v > 127 else (-127 if v < -127 else v)
+
+
+# 1 for raw axis values outside the deadzone, indexed by the 0-255 reading
+_JOY_ACTIVE_LUT = bytes(1 if abs(v - JOY_CENTER) > JOY_DEADZONE else 0 for v in range(256))
+
+# Scroll step per raw Y value, stored offset by +128 (subtract 128 to use).
+# Values inside the deadzone map to 0, so no separate check is needed.
+_SCROLL_LUT = bytes(
+    (int((v - JOY_CENTER) / SCROLL_DIVIDER) if abs(v - JOY_CENTER) > JOY_DEADZONE else 0) + 128
+    for v in range(256)
+)
 
 
 def joy_active(jx, jy):
     """Check if joystick is outside deadzone."""
-    return abs(jx - JOY_CENTER) > JOY_DEADZONE or abs(jy - JOY_CENTER) > JOY_DEADZONE
+    return _JOY_ACTIVE_LUT[jx] or _JOY_ACTIVE_LUT[jy]
 
 
 # --- Main ---
 
+def log(msg="", *args):
+    """print() msg % args only when DIAG is set.
+
+    Writes to the USB serial console block once its buffer fills with no
+    host reading it, so startup messages stay off unless diagnosing.
+    Formatting is deferred until here so disabled messages allocate nothing.
+    """
+    if DIAG:
+        print(msg % args if args else msg)
+
+
 def check_pullups():
     """Check if SDA/SCL lines have pull-up resistors."""
     for name, pin in [("SDA", I2C_SDA), ("SCL", I2C_SCL)]:
@@ -118,8 +178,39 @@ def check_pullups():
         d.pull = digitalio.Pull.UP
         with_pull = d.value
         d.deinit()
-        print(f"  {name}: external_pullup={'yes' if has_external else 'NO'}, with_internal={'high' if with_pull else 'low'}")
-    print()
+        log("  %s: external_pullup=%s, with_internal=%s", name,
+            "yes" if has_external else "NO", "high" if with_pull else "low")
+    log()
+
+
+# time.monotonic_ns() on CircuitPython advances in 1/32768 s subticks, not ns
+MONOTONIC_NS_STEP = const(30518)
+
+
+def delay_us(us):
+    """Busy-wait for at least us microseconds.
+
+    time.sleep() rounds to the nearest millisecond, so spin on
+    time.monotonic_ns() instead. That clock only moves in ~30 us steps, so
+    one extra step is added to guarantee the minimum; the actual wait is
+    between us and us + ~60 microseconds. Good enough for I2C edges that
+    need a minimum hold time, not for generating an accurate clock.
+    """
+    end = time.monotonic_ns() + us * 1000 + MONOTONIC_NS_STEP
+    while time.monotonic_ns() < end:
+        pass
+
+
+# PIO program for release_i2c_bus(): 9 SCL clock pulses, then hold SCL high.
+# At 3.2MHz each SCL half-period is 16 cycles, giving a 100kHz clock.
+#   init: set x, 8
+#   0:    set pins, 0 [15]  ; SCL low
+#   1:    set pins, 1 [14]  ; SCL high
+#   2:    jmp x-- 0         ; repeat until 9 pulses sent
+#   3:    push noblock      ; signal completion through the RX FIFO
+#   4:    jmp 4             ; done, park with SCL high
+_BUS_RECOVERY_INIT = array("H", [0xE028])
+_BUS_RECOVERY_PROGRAM = array("H", [0xEF00, 0xEE01, 0x0040, 0x8000, 0x0004])
 
 
 def release_i2c_bus():
@@ -127,35 +218,45 @@ def release_i2c_bus():
 
     Some devices (including Nunchuk) can hold SCL low after power-on or
     incomplete transactions. Toggling SCL manually sends enough clock pulses
-    to free the bus.
+    to free the bus. The pulses come from a PIO state machine so they run at
+    a true 100kHz without the CPU bit-banging them.
     """
-    print("  Sending clock pulses to release I2C bus...")
-    scl = digitalio.DigitalInOut(I2C_SCL)
+    import rp2pio
+
+    log("  Sending clock pulses to release I2C bus...")
     sda = digitalio.DigitalInOut(I2C_SDA)
-    scl.direction = digitalio.Direction.OUTPUT
     sda.direction = digitalio.Direction.INPUT
     sda.pull = digitalio.Pull.UP
 
     # Send 9 clock pulses (standard I2C bus recovery)
-    for i in range(9):
-        scl.value = False
-        time.sleep(0.001)
-        scl.value = True
-        time.sleep(0.001)
-        if sda.value:
-            print(f"  Bus released after {i + 1} clock pulses")
-            break
+    sm = rp2pio.StateMachine(
+        _BUS_RECOVERY_PROGRAM,
+        frequency=3200000,
+        init=_BUS_RECOVERY_INIT,
+        first_set_pin=I2C_SCL,
+        initial_set_pin_state=1,
+        initial_set_pin_direction=1,
+    )
+    # Block until the program pushes its completion word, so the state
+    # machine is never stopped partway through the pulse train
+    sm.readinto(array("L", [0]))
+    sm.deinit()
+    if sda.value:
+        log("  Bus released after clock pulses")
 
     # Send STOP condition: SDA low->high while SCL high
+    # (each delay_us(5) is a minimum, covering the 4.7 us I2C setup/hold times)
     sda.deinit()
+    scl = digitalio.DigitalInOut(I2C_SCL)
+    scl.switch_to_output(value=True)
     sda = digitalio.DigitalInOut(I2C_SDA)
     sda.direction = digitalio.Direction.OUTPUT
     sda.value = False
-    time.sleep(0.001)
+    delay_us(5)
     scl.value = True
-    time.sleep(0.001)
+    delay_us(5)
     sda.value = True
-    time.sleep(0.001)
+    delay_us(5)
 
     scl.deinit()
     sda.deinit()
@@ -164,39 +265,40 @@ def release_i2c_bus():
 
 def init_i2c():
     """Initialize I2C with bus recovery if needed."""
-    print("Checking I2C pull-ups...")
-    check_pullups()
+    if DIAG:
+        log("Checking I2C pull-ups...")
+        check_pullups()
 
-    print("Initializing I2C...")
+    log("Initializing I2C...")
 
     # Strategy 1: Try hardware I2C directly
     try:
         i2c = busio.I2C(I2C_SCL, I2C_SDA, frequency=100000)
-        print("  Using hardware I2C")
+        log("  Using hardware I2C")
         return i2c
     except RuntimeError as e:
-        print(f"  Hardware I2C failed: {e}")
+        log("  Hardware I2C failed: %s", e)
 
     # Strategy 2: Recover the bus and retry hardware I2C
     release_i2c_bus()
-    print("  Retrying hardware I2C after bus recovery...")
+    log("  Retrying hardware I2C after bus recovery...")
     try:
         i2c = busio.I2C(I2C_SCL, I2C_SDA, frequency=100000)
-        print("  Using hardware I2C (after recovery)")
+        log("  Using hardware I2C (after recovery)")
         return i2c
     except RuntimeError as e:
-        print(f"  Hardware I2C still failed: {e}")
+        log("  Hardware I2C still failed: %s", e)
 
     # Strategy 3: bitbangio as last resort
-    print("  Trying bitbangio (software I2C)...")
+    log("  Trying bitbangio (software I2C)...")
     import bitbangio
     for freq in [100000, 50000, 10000]:
         try:
             i2c = bitbangio.I2C(I2C_SCL, I2C_SDA, frequency=freq)
-            print(f"  Using software I2C at {freq}Hz")
+            log("  Using software I2C at %dHz", freq)
             return i2c
         except (TimeoutError, ValueError, RuntimeError) as e2:
-            print(f"  bitbangio at {freq}Hz failed: {e2}")
+            log("  bitbangio at %dHz failed: %s", freq, e2)
             try:
                 i2c.deinit()
             except Exception:
@@ -213,122 +315,183 @@ def init_i2c():
         time.sleep(1)
 
 
-def main():
-    i2c = init_i2c()
-
-    # Scan for devices
-    while not i2c.try_lock():
-        pass
-    devices = i2c.scan()
-    i2c.unlock()
-    print(f"  I2C devices found: {[hex(d) for d in devices]}")
-
-    if 0x52 not in devices:
-        print("  WARNING: Nunchuk (0x52) not found on I2C bus!")
-        print("  Check wiring: SDA->GP4, SCL->GP5, 3V3, GND")
-        print("  Retrying in 3 seconds...")
-        time.sleep(3)
-
-    nunchuk = adafruit_nunchuk.Nunchuk(i2c)
-    print("Nunchuk initialized")
-
-    # Initialize HID devices
-    keyboard = Keyboard(usb_hid.devices)
-    mouse = Mouse(usb_hid.devices)
-    print("USB HID initialized")
-
-    # Button state trackers
-    btn_c = ButtonState()
-    btn_z = ButtonState()
-
+@micropython.native
+def run(nunchuk, keyboard, mouse):
+    """Main loop: map Nunchuk input to HID reports at LOOP_MS intervals."""
     # Track whether we're holding mouse buttons (for clean release)
     left_click_held = False
     right_click_held = False
-
-    print("Ready — move joystick or press buttons")
+    # Shift+right-click drag held for horizontal pan
+    pan_active = False
+
+    # Bind hot methods to locals: one lookup here instead of one per call
+    _move = mouse.move
+    _mpress = mouse.press
+    _mrel = mouse.release
+    # Mouse's report buffer (buttons, x, y, wheel) and raw HID send, for
+    # combining a button press with a move in a single report
+    report = mouse.report
+    _send_report = mouse._mouse_device.send_report
+    _kpress = keyboard.press
+    _krel = keyboard.release
+    _ksend = keyboard.send
+    _btn_update = btn_update
+    # Driver's raw register read; returns its 6-byte data buffer
+    _read = nunchuk._read_data
+    _ticks = ticks_ms
+    _sleep = time.sleep
+
+    # Deadline for the end of the current tick, so work time doesn't add drift
+    next_tick = ticks_ms()
 
     while True:
-        now = time.monotonic()
-
-        # Read Nunchuk
-        joy = nunchuk.joystick
-        buttons = nunchuk.buttons
+        now = _ticks()
 
-        jx, jy = joy[0], joy[1]  # 0-255
-        c_pressed = buttons.C
-        z_pressed = buttons.Z
+        # Read Nunchuk (one I2C transaction for joystick + buttons)
+        # Decode the raw buffer directly so no namedtuples are allocated per tick
+        buf = _read()
+        jx, jy = buf[0], buf[1]  # 0-255
+        # Byte 5 holds the buttons, active low: bit 1 = C, bit 0 = Z
+        c_pressed = not (buf[5] & 0x02)
+        z_pressed = not (buf[5] & 0x01)
 
         # Detect movement for tap detection
         joy_moved = joy_active(jx, jy)
 
         # Update button states
-        c_event = btn_c.update(c_pressed, now, joy_moved)
-        z_event = btn_z.update(z_pressed, now, joy_moved)
+        c_event = _btn_update(BTN_C, c_pressed, now, joy_moved)
+        z_event = _btn_update(BTN_Z, z_pressed, now, joy_moved)
+
+        # A tap already costs two keyboard reports this tick, so leave
+        # joystick movement to the next tick instead of queueing behind it
+        continue_movement = True
 
         # --- Handle button C events ---
         if c_event == "tap":
-            keyboard.send(Keycode.F)
+            _ksend(Keycode.F)
+            continue_movement = False
 
         # --- Handle button Z events ---
         if z_event == "tap":
-            keyboard.send(Keycode.D)
+            _ksend(Keycode.D)
+            continue_movement = False
+
+        # Release held mouse buttons when modifier released. Done before the
+        # modifier modes so a pan starting on this tick doesn't inherit them.
+        if c_event == "hold_end" and left_click_held:
+            _mrel(Mouse.LEFT_BUTTON)
+            left_click_held = False
+
+        if z_event == "hold_end" and right_click_held:
+            _mrel(Mouse.RIGHT_BUTTON)
+            right_click_held = False
 
         # --- Modifier modes ---
 
-        if btn_c.is_pressed and btn_c.was_held:
-            # C HELD: Mouse movement + left click
-            mx = scale_axis(jx, JOY_CENTER, JOY_DEADZONE, MOUSE_SENSITIVITY)
-            my = -scale_axis(jy, JOY_CENTER, JOY_DEADZONE, MOUSE_SENSITIVITY)  # Invert Y
+        # End the pan drag before a modifier mode (or an idle stick) takes over
+        c_held = _flags[BTN_C] & BTN_HELD
+        z_held = _flags[BTN_Z] & BTN_HELD
+        if pan_active and (not joy_moved or c_held or z_held):
+            _mrel(Mouse.RIGHT_BUTTON)
+            _krel(Keycode.SHIFT)
+            pan_active = False
+
+        if continue_movement:
+            if c_held:
+                # C HELD: Mouse movement + left click
+                if not left_click_held:
+                    _mpress(Mouse.LEFT_BUTTON)
+                    left_click_held = True
+
+                # Stick in the deadzone scales to zero, so skip the work entirely
+                if joy_moved:
+                    mx = scale_axis_fast(jx, SCALE_MOUSE_K)
+                    my = -scale_axis_fast(jy, SCALE_MOUSE_K)  # Invert Y
+                    if mx != 0 or my != 0:
+                        _move(mx, my)
+
+            elif z_held:
+                # Z HELD: Orbit via joystick (right mouse button + drag)
+                if not right_click_held:
+                    _mpress(Mouse.RIGHT_BUTTON)
+                    right_click_held = True
+
+                if joy_moved:
+                    mx = scale_axis_fast(jx, SCALE_ORBIT_K)
+                    my = -scale_axis_fast(jy, SCALE_ORBIT_K)
+                    if mx != 0 or my != 0:
+                        _move(mx, my)
+
+            else:
+                # NO MODIFIER: Joystick controls zoom and pan
+                if joy_moved:
+                    # Vertical: scroll wheel (zoom)
+                    scroll = _SCROLL_LUT[jy] - 128
+
+                    # Horizontal: pan left/right via middle mouse + horizontal move
+                    # TinkerCAD: middle mouse drag pans, so we use shift+right click drag.
+                    # The drag is pressed once on entering pan and held until the
+                    # stick returns to center, so each tick only sends the move.
+                    sx = scale_axis_fast(jx, SCALE_MOUSE_K)
+                    if sx != 0 and not pan_active:
+                        _kpress(Keycode.SHIFT)
+                        # Press right button, first pan step and zoom in one report.
+                        # No other button is held outside the C/Z modes, so the
+                        # drag's report carries RIGHT alone.
+                        report[0] = Mouse.RIGHT_BUTTON
+                        report[1] = sx & 0xFF
+                        report[2] = 0
+                        report[3] = scroll & 0xFF
+                        _send_report(report)
+                        pan_active = True
+                    else:
+                        if sx == 0 and pan_active:
+                            _mrel(Mouse.RIGHT_BUTTON)
+                            _krel(Keycode.SHIFT)
+                            pan_active = False
+
+                        # Pan and zoom share one report when the stick is diagonal
+                        if sx != 0 or scroll != 0:
+                            _move(sx, 0, scroll)
+
+        # Sleep only for what's left of this tick
+        next_tick = (next_tick + LOOP_MS) & (TICKS_PERIOD - 1)
+        delay = (next_tick - _ticks()) & (TICKS_PERIOD - 1)
+        if delay < 500:
+            _sleep(delay / 1000)
+        else:
+            # Fell behind the deadline: resync rather than trying to catch up
+            next_tick = _ticks()
 
-            if not left_click_held:
-                mouse.press(Mouse.LEFT_BUTTON)
-                left_click_held = True
 
-            if mx != 0 or my != 0:
-                mouse.move(mx, my)
+def main():
+    i2c = init_i2c()
 
-        elif btn_z.is_pressed and btn_z.was_held:
-            # Z HELD: Orbit via joystick (right mouse button + drag)
-            mx = scale_axis(jx, JOY_CENTER, JOY_DEADZONE, ORBIT_SENSITIVITY)
-            my = -scale_axis(jy, JOY_CENTER, JOY_DEADZONE, ORBIT_SENSITIVITY)
+    if DIAG:
+        # Scan for devices
+        while not i2c.try_lock():
+            pass
+        devices = i2c.scan()
+        i2c.unlock()
+        log("  I2C devices found: %s", [hex(d) for d in devices])
 
-            if not right_click_held:
-                mouse.press(Mouse.RIGHT_BUTTON)
-                right_click_held = True
+        if 0x52 not in devices:
+            log("  WARNING: Nunchuk (0x52) not found on I2C bus!")
+            log("  Check wiring: SDA->GP4, SCL->GP5, 3V3, GND")
+            log("  Retrying in 3 seconds...")
+            time.sleep(3)
 
-            if mx != 0 or my != 0:
-                mouse.move(mx, my)
+    nunchuk = adafruit_nunchuk.Nunchuk(i2c)
+    log("Nunchuk initialized")
 
-        else:
-            # NO MODIFIER: Joystick controls zoom and pan
-            if joy_moved:
-                # Vertical: scroll wheel (zoom)
-                sy = jy - JOY_CENTER
-                if abs(sy) > JOY_DEADZONE:
-                    scroll = int(sy / SCROLL_DIVIDER)
-                    if scroll != 0:
-                        mouse.move(0, 0, scroll)
-
-                # Horizontal: pan left/right via middle mouse + horizontal move
-                # TinkerCAD: middle mouse drag pans, so we use shift+right click drag
-                sx = scale_axis(jx, JOY_CENTER, JOY_DEADZONE, MOUSE_SENSITIVITY)
-                if sx != 0:
-                    keyboard.press(Keycode.SHIFT)
-                    mouse.press(Mouse.RIGHT_BUTTON)
-                    mouse.move(sx, 0)
-                    mouse.release(Mouse.RIGHT_BUTTON)
-                    keyboard.release(Keycode.SHIFT)
-
-        # Release held mouse buttons when modifier released
-        if c_event == "hold_end" and left_click_held:
-            mouse.release(Mouse.LEFT_BUTTON)
-            left_click_held = False
+    # Initialize HID devices
+    keyboard = Keyboard(usb_hid.devices)
+    mouse = Mouse(usb_hid.devices)
+    log("USB HID initialized")
 
-        if z_event == "hold_end" and right_click_held:
-            mouse.release(Mouse.RIGHT_BUTTON)
-            right_click_held = False
+    log("Ready — move joystick or press buttons")
 
-        time.sleep(LOOP_DELAY)
+    run(nunchuk, keyboard, mouse)
 
 
 main()